@@ -0,0 +1,8 @@
+-- Extensions used by the API.
+-- Docker runs this only when the database volume is first created (dev and
+-- prod both mount ./init-db). It does not touch existing databases: the
+-- Alembic migration that adds the trigram index must also run
+-- CREATE EXTENSION IF NOT EXISTS pg_trgm, and is the source of truth.
+
+-- Trigram matching for the user search typeahead (GIN index on users).
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
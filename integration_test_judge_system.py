@@ -4,6 +4,7 @@ Integration test for the complete judge system
 Tests the full workflow from assignment to acceptance
 """
 
+import os
 import requests
 import json
 import time
@@ -11,17 +12,29 @@ from typing import Dict, Any
 
 class JudgeSystemIntegrationTest:
     def __init__(self):
-        self.backend_url = "http://localhost:8000"
-        self.frontend_url = "http://localhost:3001"
+        self.backend_url = os.getenv("HUB_BACKEND_URL", "http://localhost:8000")
+        self.frontend_url = os.getenv("HUB_FRONTEND_URL", "http://localhost:3001")
         
-        # Test data
-        self.creator_token = "test_creator_token"
-        self.judge_token = "test_judge_token"
-        self.project_id = 1
-        self.judge_user_id = 2
+        # Test data (override with real tokens/ids to run against a seeded database)
+        self.creator_token = os.getenv("HUB_CREATOR_TOKEN", "test_creator_token")
+        self.judge_token = os.getenv("HUB_JUDGE_TOKEN", "test_judge_token")
+        self.project_id = int(os.getenv("HUB_PROJECT_ID", "1"))
+        self.judge_user_id = int(os.getenv("HUB_JUDGE_USER_ID", "2"))
+        
+        # Fake tokens can only ever get 401/422. A real token must succeed or
+        # hit a business-rule error (e.g. judge already assigned), so an
+        # expired or wrong real token fails the test
+        self.creator_expected_statuses = self.expected_statuses_for("HUB_CREATOR_TOKEN")
+        self.judge_expected_statuses = self.expected_statuses_for("HUB_JUDGE_TOKEN")
         
         self.test_results = []
     
+    def expected_statuses_for(self, token_env: str):
+        """Status codes that count as a pass for the token in token_env"""
+        if token_env in os.environ:
+            return [200, 201, 400, 409]
+        return [401, 422]
+    
     def log_test(self, test_name: str, passed: bool, message: str = ""):
         """Log test result"""
         status = "✅ PASS" if passed else "❌ FAIL"
@@ -53,9 +66,9 @@ class JudgeSystemIntegrationTest:
                 headers={"Authorization": f"Bearer {self.creator_token}"}
             )
             
-            # For testing, we expect 401 (unauthorized) since we're using fake tokens
-            # In production, this would be 201 (created)
-            if response.status_code in [401, 422]:
+            # With the default fake tokens we expect 401 (unauthorized)
+            # With real tokens (HUB_CREATOR_TOKEN) this would be 201 (created)
+            if response.status_code in self.creator_expected_statuses:
                 self.log_test(test_name, True, "Endpoint exists and responds correctly")
             else:
                 self.log_test(test_name, False, f"Unexpected status code: {response.status_code}")
@@ -73,7 +86,7 @@ class JudgeSystemIntegrationTest:
                 headers={"Authorization": f"Bearer {self.creator_token}"}
             )
             
-            if response.status_code in [401, 422]:
+            if response.status_code in self.creator_expected_statuses:
                 self.log_test(test_name, True, "Endpoint exists and responds correctly")
             else:
                 self.log_test(test_name, False, f"Unexpected status code: {response.status_code}")
@@ -97,7 +110,7 @@ class JudgeSystemIntegrationTest:
                 headers={"Authorization": f"Bearer {self.judge_token}"}
             )
             
-            if response.status_code in [401, 422]:
+            if response.status_code in self.judge_expected_statuses:
                 self.log_test(test_name, True, "Endpoint exists and responds correctly")
             else:
                 self.log_test(test_name, False, f"Unexpected status code: {response.status_code}")
@@ -115,7 +128,7 @@ class JudgeSystemIntegrationTest:
                 headers={"Authorization": f"Bearer {self.judge_token}"}
             )
             
-            if response.status_code in [401, 422]:
+            if response.status_code in self.judge_expected_statuses:
                 self.log_test(test_name, True, "Endpoint exists and responds correctly")
             else:
                 self.log_test(test_name, False, f"Unexpected status code: {response.status_code}")
@@ -133,7 +146,7 @@ class JudgeSystemIntegrationTest:
                 headers={"Authorization": f"Bearer {self.judge_token}"}
             )
             
-            if response.status_code in [401, 422]:
+            if response.status_code in self.judge_expected_statuses:
                 self.log_test(test_name, True, "Endpoint exists and responds correctly")
             else:
                 self.log_test(test_name, False, f"Unexpected status code: {response.status_code}")
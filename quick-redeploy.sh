@@ -40,20 +40,33 @@ docker-compose -f docker-compose.prod.yml build --no-cache frontend
 print_status "Starting all services..."
 docker-compose -f docker-compose.prod.yml up -d
 
-print_status "Waiting for services to be ready..."
-sleep 30
+# Poll a URL until it responds or the timeout (seconds) runs out
+wait_for_url() {
+    local deadline=$(( $(date +%s) + $2 ))
+    while [ "$(date +%s)" -lt "$deadline" ]; do
+        if curl -f --max-time 5 "$1" &>/dev/null; then
+            return 0
+        fi
+        sleep 1
+    done
+    return 1
+}
 
-print_status "Checking service health..."
+# Poll each service instead of sleeping a fixed time
+print_status "Checking service health (timeout: 120s each)..."
 
-# Check API
-if curl -f http://localhost:8000/health &>/dev/null; then
-    print_success "✅ API is healthy"
+# Check API, and report its cold start: container start to first healthy
+# /health (excludes the time spent waiting for the db healthcheck)
+if wait_for_url http://localhost:8000/health 120; then
+    API_STARTED_AT=$(docker inspect -f '{{.State.StartedAt}}' hub_prod_api)
+    API_COLD_START=$(( $(date +%s) - $(date -d "$API_STARTED_AT" +%s) ))
+    print_success "✅ API is healthy (cold start: ${API_COLD_START}s)"
 else
     print_error "❌ API health check failed"
 fi
 
 # Check Frontend
-if curl -f http://localhost:3000 &>/dev/null; then
+if wait_for_url http://localhost:3000 120; then
     print_success "✅ Frontend is healthy"
 else
     print_error "❌ Frontend health check failed"
@@ -9,7 +9,7 @@ import sys
 import os
 from pathlib import Path
 
-def run_command(command, cwd=None, description=""):
+def run_command(command, cwd=None, description="", timeout=300):
     """Run a command and return the result"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
@@ -24,7 +24,7 @@ def run_command(command, cwd=None, description=""):
             cwd=cwd,
             capture_output=True,
             text=True,
-            timeout=300  # 5 minutes timeout
+            timeout=timeout  # 5 minutes by default
         )
         
         if result.stdout:
@@ -216,6 +216,50 @@ def run_e2e_tests():
         description="End-to-End Tests"
     )
 
+def run_benchmarks(save_baseline=False, required=False):
+    """Run in-process service benchmarks (optional unless required)"""
+    print("\n⏱️  Starting Service Benchmarks")
+    
+    backend_dir = "onchain_fastapi"
+    bench_dir = os.path.join(backend_dir, "tests", "benchmarks")
+    # Fixed baseline, only rewritten on request, so regressions can't creep in
+    baseline = "tests/benchmarks/baseline.json"
+    
+    # Check if pytest-benchmark is available
+    try:
+        import pytest_benchmark
+    except ImportError:
+        print("❌ pytest-benchmark not installed. Skipping benchmarks.")
+        print("Install with: pip install pytest-benchmark")
+        # Don't fail a full run, but a bench-only run that ran nothing fails
+        return not required
+    
+    if not os.path.exists(bench_dir):
+        print(f"❌ Benchmark directory '{bench_dir}' not found. Skipping benchmarks.")
+        return not required
+    
+    if save_baseline:
+        return run_command(
+            f"python -m pytest tests/benchmarks --benchmark-only --benchmark-json={baseline}",
+            cwd=backend_dir,
+            description="Saving Benchmark Baseline",
+            timeout=3600
+        )
+    
+    if not os.path.exists(os.path.join(backend_dir, baseline)):
+        print(f"❌ No benchmark baseline at '{os.path.join(backend_dir, baseline)}'")
+        print("Create one with: python test_runner.py bench --save-baseline")
+        return False
+    
+    # Fail on a mean regression of more than 20% against the saved baseline
+    return run_command(
+        "python -m pytest tests/benchmarks --benchmark-only "
+        f"--benchmark-compare={baseline} --benchmark-compare-fail=mean:20%",
+        cwd=backend_dir,
+        description="Service Benchmarks",
+        timeout=3600
+    )
+
 def generate_test_report():
     """Generate a comprehensive test report"""
     print("\n📊 Generating Test Report")
@@ -316,6 +360,14 @@ def main():
     print("🧪 Submission System Test Runner")
     print("=" * 60)
     
+    # Benchmarks only: python test_runner.py bench [--save-baseline]
+    if sys.argv[1:2] == ["bench"]:
+        passed = run_benchmarks(
+            save_baseline="--save-baseline" in sys.argv[2:],
+            required=True
+        )
+        sys.exit(0 if passed else 1)
+    
     # Check dependencies
     if not check_dependencies():
         print("\n❌ Dependency check failed. Please install missing dependencies.")
@@ -336,6 +388,10 @@ def main():
     # Run E2E tests (optional)
     results['e2e'] = run_e2e_tests()
     
+    # Run benchmarks after the other suites (optional, opt-in with --bench)
+    if "--bench" in sys.argv[1:]:
+        results['bench'] = run_benchmarks()
+    
     # Generate report
     generate_test_report()
     